@@ -140,6 +140,14 @@ base_control = BaseControl(config_manager.config, time_zone, time_frame_base)
 # initialize the inverter interface
 inverter_interface = None
 
+# inverter types with a direct battery control interface
+INVERTER_INTERFACES = {
+    # enhanced interface with firmware-based authentication (default)
+    "fronius_gen24": FroniusWRV2,
+    # legacy V1 interface (for corner cases)
+    "fronius_gen24_legacy": FroniusWR,
+}
+
 # Handle backward compatibility for old interface names
 inverter_type = config_manager.config["inverter"]["type"]
 if inverter_type == "fronius_gen24_v2":
@@ -150,25 +158,12 @@ if inverter_type == "fronius_gen24_v2":
     )
     inverter_type = "fronius_gen24"  # Auto-migrate to new name
 
-if inverter_type == "fronius_gen24":
-    # Enhanced V2 interface (default for existing users)
-    logger.info(
-        "[Inverter] Using enhanced Fronius GEN24 interface with firmware-based authentication"
-    )
-    inverter_config = {
-        "address": config_manager.config["inverter"]["address"],
-        "max_grid_charge_rate": config_manager.config["inverter"][
-            "max_grid_charge_rate"
-        ],
-        "max_pv_charge_rate": config_manager.config["inverter"]["max_pv_charge_rate"],
-        "user": config_manager.config["inverter"]["user"],
-        "password": config_manager.config["inverter"]["password"],
-    }
-    inverter_interface = FroniusWRV2(inverter_config)
-elif inverter_type == "fronius_gen24_legacy":
-    # Legacy V1 interface (for corner cases)
+if inverter_type in INVERTER_INTERFACES:
+    inverter_class = INVERTER_INTERFACES[inverter_type]
     logger.info(
-        "[Inverter] Using legacy Fronius GEN24 interface (V1) for compatibility"
+        "[Inverter] Inverter type %s - using the %s interface.",
+        inverter_type,
+        inverter_class.__name__,
     )
     inverter_config = {
         "address": config_manager.config["inverter"]["address"],
@@ -179,7 +174,7 @@ elif inverter_type == "fronius_gen24_legacy":
         "user": config_manager.config["inverter"]["user"],
         "password": config_manager.config["inverter"]["password"],
     }
-    inverter_interface = FroniusWR(inverter_config)
+    inverter_interface = inverter_class(inverter_config)
 elif inverter_type == "evcc":
     logger.info(
         "[Inverter] Inverter type %s - using the universal evcc external battery control.",
@@ -1034,39 +1029,28 @@ class OptimizationScheduler:
         self.__start_update_service_data_loop()
 
     def __run_data_loop(self):
-        if inverter_type in ["fronius_gen24", "fronius_gen24_legacy"]:
+        if inverter_type in INVERTER_INTERFACES:
             inverter_interface.fetch_inverter_data()
+            inverter_data = inverter_interface.get_inverter_current_data()
             mqtt_interface.update_publish_topics(
                 {
                     "inverter/special/temperature_inverter": {
-                        "value": inverter_interface.get_inverter_current_data()[
-                            "DEVICE_TEMPERATURE_AMBIENTEMEAN_F32"
-                        ]
+                        "value": inverter_data["DEVICE_TEMPERATURE_AMBIENTEMEAN_F32"]
                     },
                     "inverter/special/temperature_ac_module": {
-                        "value": inverter_interface.get_inverter_current_data()[
-                            "MODULE_TEMPERATURE_MEAN_01_F32"
-                        ]
+                        "value": inverter_data["MODULE_TEMPERATURE_MEAN_01_F32"]
                     },
                     "inverter/special/temperature_dc_module": {
-                        "value": inverter_interface.get_inverter_current_data()[
-                            "MODULE_TEMPERATURE_MEAN_03_F32"
-                        ]
+                        "value": inverter_data["MODULE_TEMPERATURE_MEAN_03_F32"]
                     },
                     "inverter/special/temperature_battery_module": {
-                        "value": inverter_interface.get_inverter_current_data()[
-                            "MODULE_TEMPERATURE_MEAN_04_F32"
-                        ]
+                        "value": inverter_data["MODULE_TEMPERATURE_MEAN_04_F32"]
                     },
                     "inverter/special/fan_control_01": {
-                        "value": inverter_interface.get_inverter_current_data()[
-                            "FANCONTROL_PERCENT_01_F32"
-                        ]
+                        "value": inverter_data["FANCONTROL_PERCENT_01_F32"]
                     },
                     "inverter/special/fan_control_02": {
-                        "value": inverter_interface.get_inverter_current_data()[
-                            "FANCONTROL_PERCENT_02_F32"
-                        ]
+                        "value": inverter_data["FANCONTROL_PERCENT_02_F32"]
                     },
                 }
             )
@@ -1123,7 +1107,7 @@ def change_control_state():
     """
     inverter_fronius_en = False
     inverter_evcc_en = False
-    if inverter_type in ["fronius_gen24", "fronius_gen24_legacy"]:
+    if inverter_type in INVERTER_INTERFACES:
         inverter_fronius_en = True
     elif config_manager.config["inverter"]["type"] == "evcc":
         inverter_evcc_en = True
@@ -1467,7 +1451,7 @@ def get_controls():
         "inverter": {
             "inverter_special_data": (
                 inverter_interface.get_inverter_current_data()
-                if inverter_type in ["fronius_gen24", "fronius_gen24_legacy"]
+                if inverter_type in INVERTER_INTERFACES
                 and inverter_interface is not None
                 else None
             )
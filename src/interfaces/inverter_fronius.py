@@ -30,7 +30,6 @@ import requests
 
 # logger = logging.getLogger('__main__')
 logger = logging.getLogger("__main__").getChild("Fronius")
-logger.setLevel(logging.INFO)
 logger.info("[Inverter] loading module ")
 
 
@@ -58,6 +57,17 @@ base_path = os.path.dirname(os.path.abspath(__file__))
 TIMEOFUSE_CONFIG_FILENAME = base_path + "/config/timeofuse_config.json"
 BATTERY_CONFIG_FILENAME = base_path + "/config/battery_config.json"
 
+# (inverter_current_data key, channel name in /components/inverter/readable)
+INVERTER_DATA_CHANNELS = (
+    ("DEVICE_TEMPERATURE_AMBIENTEMEAN_F32", "DEVICE_TEMPERATURE_AMBIENTMEAN_01_F32"),
+    ("MODULE_TEMPERATURE_MEAN_01_F32", "MODULE_TEMPERATURE_MEAN_01_F32"),
+    ("MODULE_TEMPERATURE_MEAN_03_F32", "MODULE_TEMPERATURE_MEAN_03_F32"),
+    ("MODULE_TEMPERATURE_MEAN_04_F32", "MODULE_TEMPERATURE_MEAN_04_F32"),
+    ("FANCONTROL_PERCENT_01_F32", "FANCONTROL_PERCENT_01_F32"),
+    ("FANCONTROL_PERCENT_02_F32", "FANCONTROL_PERCENT_02_F32"),
+)
+INVERTER_DATA_KEYS = tuple(key for key, _ in INVERTER_DATA_CHANNELS)
+
 
 # class FroniusWR(InverterBaseclass):
 class FroniusWR:
@@ -81,14 +91,7 @@ class FroniusWR:
         self.__get_current_inverter_sw_version()
         self.__set_api_praefix()
 
-        self.inverter_current_data = {
-            "DEVICE_TEMPERATURE_AMBIENTEMEAN_F32": 0,
-            "MODULE_TEMPERATURE_MEAN_01_F32": 0,
-            "MODULE_TEMPERATURE_MEAN_03_F32": 0,
-            "MODULE_TEMPERATURE_MEAN_04_F32": 0,
-            "FANCONTROL_PERCENT_01_F32": 0,
-            "FANCONTROL_PERCENT_02_F32": 0,
-        }
+        self.inverter_current_data = dict.fromkeys(INVERTER_DATA_KEYS, 0)
 
         self.previous_battery_config = self.get_battery_config()
         self.previous_backup_power_config = None
@@ -365,24 +368,8 @@ class FroniusWR:
         result = json.loads(response.text)["Body"]["Data"]["0"]["channels"]
 
         self.inverter_current_data = {
-            "DEVICE_TEMPERATURE_AMBIENTEMEAN_F32": round(
-                result.get("DEVICE_TEMPERATURE_AMBIENTMEAN_01_F32", 0), 2
-            ),
-            "MODULE_TEMPERATURE_MEAN_01_F32": round(
-                result.get("MODULE_TEMPERATURE_MEAN_01_F32", 0), 2
-            ),
-            "MODULE_TEMPERATURE_MEAN_03_F32": round(
-                result.get("MODULE_TEMPERATURE_MEAN_03_F32", 0), 2
-            ),
-            "MODULE_TEMPERATURE_MEAN_04_F32": round(
-                result.get("MODULE_TEMPERATURE_MEAN_04_F32", 0), 2
-            ),
-            "FANCONTROL_PERCENT_01_F32": round(
-                result.get("FANCONTROL_PERCENT_01_F32", 0), 2
-            ),
-            "FANCONTROL_PERCENT_02_F32": round(
-                result.get("FANCONTROL_PERCENT_02_F32", 0), 2
-            ),
+            key: round(result.get(channel, 0), 2)
+            for key, channel in INVERTER_DATA_CHANNELS
         }
 
         logger.debug("[Inverter] Inverter data: %s", self.inverter_current_data)
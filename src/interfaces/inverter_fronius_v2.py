@@ -20,12 +20,28 @@ import logging
 import json
 import hashlib
 import re
+import secrets
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger("__main__").getChild("FroniusV2")
-logger.setLevel(logging.INFO)
 logger.info("[InverterV2] Loading Fronius GEN24 V2 with updated authentication")
 
+# (inverter_current_data key, channel name in /components/inverter/readable)
+INVERTER_DATA_CHANNELS = (
+    ("DEVICE_TEMPERATURE_AMBIENTEMEAN_F32", "DEVICE_TEMPERATURE_AMBIENTMEAN_01_F32"),
+    ("MODULE_TEMPERATURE_MEAN_01_F32", "MODULE_TEMPERATURE_MEAN_01_F32"),
+    ("MODULE_TEMPERATURE_MEAN_03_F32", "MODULE_TEMPERATURE_MEAN_03_F32"),
+    ("MODULE_TEMPERATURE_MEAN_04_F32", "MODULE_TEMPERATURE_MEAN_04_F32"),
+    ("FANCONTROL_PERCENT_01_F32", "FANCONTROL_PERCENT_01_F32"),
+    ("FANCONTROL_PERCENT_02_F32", "FANCONTROL_PERCENT_02_F32"),
+)
+INVERTER_DATA_KEYS = tuple(key for key, _ in INVERTER_DATA_CHANNELS)
+
+# key=value / key="value" pairs of a digest challenge (quoted values keep spaces)
+AUTH_HEADER_PATTERN = re.compile(r'(\w+)=(?:"([^"]*)"|([^,]*))')
+
 
 def hash_utf8_md5(x):
     """Hash a string or bytes object with MD5 (legacy support)."""
@@ -42,14 +58,15 @@ def hash_utf8_sha256(x):
 
 
 def strip_dict(original):
-    """Strip all keys starting with '_' from a dictionary."""
+    """Strip all keys starting with '_' from a dictionary.
+
+    Returns the original dictionary unchanged (no copy) if it has no such keys.
+    """
     if not isinstance(original, dict):
         return original
-    stripped_copy = {}
-    for key in original.keys():
-        if not key.startswith("_"):
-            stripped_copy[key] = original[key]
-    return stripped_copy
+    if not any(key.startswith("_") for key in original):
+        return original
+    return {key: value for key, value in original.items() if not key.startswith("_")}
 
 
 class FroniusWRV2:
@@ -77,14 +94,25 @@ class FroniusWRV2:
         self.min_soc = config.get("min_soc", 15)
         self.max_soc = config.get("max_soc", 100)
 
-        # HTTP session setup
+        # HTTP session setup - one pooled keep-alive connection to the inverter
         self.session = requests.Session()
         self.session.timeout = 10
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)
+            ),
+        )
+        self.session.mount(f"http://{self.address}", adapter)
 
         # Authentication state
         self.nonce = None
         self.is_authenticated = False
         self.algorithm = "SHA256"  # Will be determined by firmware version
+        # H(user:realm:password) only depends on the credentials - cache it
+        # per hash function instead of rehashing it for every request
+        self._ha1_cache = {}
 
         # Firmware version detection
         self.inverter_sw_revision = {"major": 0, "minor": 0, "patch": 0, "build": 0}
@@ -98,17 +126,10 @@ class FroniusWRV2:
         )
 
         # Initialize inverter monitoring data storage
-        self.inverter_current_data = {
-            "DEVICE_TEMPERATURE_AMBIENTEMEAN_F32": 0.0,
-            "MODULE_TEMPERATURE_MEAN_01_F32": 0.0,
-            "MODULE_TEMPERATURE_MEAN_03_F32": 0.0,
-            "MODULE_TEMPERATURE_MEAN_04_F32": 0.0,
-            "FANCONTROL_PERCENT_01_F32": 0.0,
-            "FANCONTROL_PERCENT_02_F32": 0.0,
-        }
+        self.inverter_current_data = dict.fromkeys(INVERTER_DATA_KEYS, 0.0)
 
         logger.info(
-            f"[InverterV2] Initialized for {self.address} with user '{self.user}'"
+            "[InverterV2] Initialized for %s with user '%s'", self.address, self.user
         )
 
         # Detect firmware version and set API configuration
@@ -132,10 +153,13 @@ class FroniusWRV2:
         self._set_api_configuration()
 
         logger.info(
-            f"[InverterV2] Firmware {self.inverter_sw_revision['major']}."
-            f"{self.inverter_sw_revision['minor']}."
-            f"{self.inverter_sw_revision['patch']}-{self.inverter_sw_revision['build']} "
-            f"configured: API base='{self.api_base}', Auth={self.algorithm}"
+            "[InverterV2] Firmware %s.%s.%s-%s configured: API base='%s', Auth=%s",
+            self.inverter_sw_revision["major"],
+            self.inverter_sw_revision["minor"],
+            self.inverter_sw_revision["patch"],
+            self.inverter_sw_revision["build"],
+            self.api_base,
+            self.algorithm,
         )
 
     def _get_current_inverter_sw_version(self):
@@ -146,7 +170,8 @@ class FroniusWRV2:
 
             if response.status_code != 200:
                 logger.error(
-                    f"[InverterV2] Failed to get firmware version: {response.status_code}"
+                    "[InverterV2] Failed to get firmware version: %s",
+                    response.status_code,
                 )
                 return False
 
@@ -166,11 +191,11 @@ class FroniusWRV2:
                 "build": int(version_string.split("-")[1]),
             }
 
-            logger.info(f"[InverterV2] Detected firmware version: {version_string}")
+            logger.info("[InverterV2] Detected firmware version: %s", version_string)
             return True
 
         except (requests.RequestException, ValueError, KeyError, IndexError) as e:
-            logger.error(f"[InverterV2] Error getting firmware version: {e}")
+            logger.error("[InverterV2] Error getting firmware version: %s", e)
             return False
 
     def _set_api_configuration(self):
@@ -274,8 +299,7 @@ class FroniusWRV2:
             auth_content = auth_header.replace("Digest ", "", 1)
 
             # Split by comma but preserve quoted values
-            pattern = r'(\w+)=(?:"([^"]*)"|([^,]*))'
-            matches = re.findall(pattern, auth_content)
+            matches = AUTH_HEADER_PATTERN.findall(auth_content)
 
             for match in matches:
                 key = match[0]
@@ -286,29 +310,29 @@ class FroniusWRV2:
             nonce = auth_dict.get("nonce")
 
             logger.debug(
-                f"[InverterV2] Extracted nonce, using firmware-determined"
-                f" algorithm: {self.algorithm}"
+                "[InverterV2] Extracted nonce, using firmware-determined algorithm: %s",
+                self.algorithm,
             )
             logger.debug(
-                f"[InverterV2] Server realm: '{auth_dict.get('realm', 'unknown')}'"
+                "[InverterV2] Server realm: '%s'", auth_dict.get("realm", "unknown")
             )
             return nonce
 
         except (requests.RequestException, ValueError, KeyError) as e:
-            logger.error(f"[InverterV2] Failed to extract nonce: {e}")
+            logger.error("[InverterV2] Failed to extract nonce: %s", e)
             return None
 
-    def _create_auth_header(
-        self, method, path, nonce, cnonce="7d5190133564493d953a7193d9d120a2"
-    ):
+    def _create_auth_header(self, method, path, nonce, cnonce=None):
         """Create digest authentication header with proper algorithm support."""
         try:
             realm = "Webinterface area"  # FIXED: Include the space
+            # Every request answers a fresh challenge, so nc is always 1
             nc = "00000001"
+            if cnonce is None:
+                cnonce = secrets.token_hex(16)
             qop = "auth"
 
             # Create digest auth components
-            auth_a1 = f"{self.user}:{realm}:{self.password}"
             auth_a2 = f"{method}:{path}"
 
             # Choose hash function based on algorithm - FIXED logic
@@ -322,8 +346,11 @@ class FroniusWRV2:
                 hash_func = hash_utf8_md5
                 algorithm_header = "MD5"
 
-            # Calculate hashes
-            hash_a1 = hash_func(auth_a1)
+            # Calculate hashes (HA1 is constant for the configured credentials)
+            hash_a1 = self._ha1_cache.get(hash_func)
+            if hash_a1 is None:
+                hash_a1 = hash_func(f"{self.user}:{realm}:{self.password}")
+                self._ha1_cache[hash_func] = hash_a1
             hash_a2 = hash_func(auth_a2)
 
             # Create response hash
@@ -343,13 +370,11 @@ class FroniusWRV2:
                 f'response="{response_hash}"'
             )
 
-            logger.debug(f"[InverterV2] Created auth header with {algorithm_header}")
-            logger.debug(f"[InverterV2] A1: {auth_a1}")
-            logger.debug(f"[InverterV2] HA1: {hash_a1}")
+            logger.debug("[InverterV2] Created auth header with %s", algorithm_header)
             return auth_header
 
         except (ValueError, KeyError) as e:
-            logger.error(f"[InverterV2] Failed to create auth header: {e}")
+            logger.error("[InverterV2] Failed to create auth header: %s", e)
             return None
 
     def _make_authenticated_request(self, method, endpoint, data=None, max_retries=3):
@@ -371,7 +396,8 @@ class FroniusWRV2:
                     nonce = self._get_nonce(response)
                     if not nonce:
                         logger.error(
-                            f"[InverterV2] Could not get nonce on attempt {attempt + 1}"
+                            "[InverterV2] Could not get nonce on attempt %d",
+                            attempt + 1,
                         )
                         continue
 
@@ -380,7 +406,8 @@ class FroniusWRV2:
                     auth_header = self._create_auth_header(method, full_path, nonce)
                     if not auth_header:
                         logger.error(
-                            f"[InverterV2] Could not create auth header on attempt {attempt + 1}"
+                            "[InverterV2] Could not create auth header on attempt %d",
+                            attempt + 1,
                         )
                         continue
 
@@ -393,7 +420,8 @@ class FroniusWRV2:
 
                     if response.status_code == 200:
                         logger.debug(
-                            f"[InverterV2] Authentication successful with {self.algorithm}"
+                            "[InverterV2] Authentication successful with %s",
+                            self.algorithm,
                         )
                         return response
 
@@ -421,15 +449,18 @@ class FroniusWRV2:
                         else:
                             # For older firmware or already using MD5, auth failure is final
                             logger.error(
-                                f"[InverterV2] Authentication failed with {self.algorithm}:"
-                                f" {response.status_code} - Invalid credentials"
+                                "[InverterV2] Authentication failed with %s:"
+                                " %s - Invalid credentials",
+                                self.algorithm,
+                                response.status_code,
                             )
                             logger.error(
-                                f"[InverterV2] TROUBLESHOOTING: If you recently updated your"
-                                f" inverter firmware (to 1.38.x-y), you may need to reset"
-                                f" your password in the WebUI (http://{self.address}/)."
-                                f" New firmware versions require"
-                                f" password reset after updates."
+                                "[InverterV2] TROUBLESHOOTING: If you recently updated your"
+                                " inverter firmware (to 1.38.x-y), you may need to reset"
+                                " your password in the WebUI (http://%s/)."
+                                " New firmware versions require"
+                                " password reset after updates.",
+                                self.address,
                             )
                             logger.error(
                                 "[InverterV2] Go to WebUI -> Settings -> User Management -> "
@@ -438,26 +469,31 @@ class FroniusWRV2:
                             break
                     else:
                         logger.error(
-                            f"[InverterV2] Authentication failed: {response.status_code}"
+                            "[InverterV2] Authentication failed: %s",
+                            response.status_code,
                         )
 
                 else:
                     # For non-auth errors, return the response so caller can handle it
                     if response.status_code == 404:
-                        logger.debug(f"[InverterV2] Endpoint not found: {endpoint}")
+                        logger.debug("[InverterV2] Endpoint not found: %s", endpoint)
                         return response  # Let caller handle 404
                     else:
-                        logger.error(f"[InverterV2] HTTP error: {response.status_code}")
+                        logger.error(
+                            "[InverterV2] HTTP error: %s", response.status_code
+                        )
 
             except (requests.RequestException, ValueError, KeyError) as e:
                 logger.error(
-                    f"[InverterV2] Request failed on attempt {attempt + 1}: {e}"
+                    "[InverterV2] Request failed on attempt %d: %s", attempt + 1, e
                 )
 
             if attempt < max_retries - 1:
                 time.sleep(1)
 
-        logger.error(f"[InverterV2] All {max_retries} attempts failed for {endpoint}")
+        logger.error(
+            "[InverterV2] All %d attempts failed for %s", max_retries, endpoint
+        )
         return None
 
     # Battery mode control methods (same interface as evcc)
@@ -472,7 +508,7 @@ class FroniusWRV2:
         Returns:
             bool: True if successful
         """
-        logger.info(f"[InverterV2] Setting battery mode: {mode}")
+        logger.info("[InverterV2] Setting battery mode: %s", mode)
 
         if mode == "normal":
             return self._set_mode_normal()
@@ -480,7 +516,7 @@ class FroniusWRV2:
             return self._set_mode_hold()
         if mode == "charge":
             return self._set_mode_charge()
-        logger.error(f"[InverterV2] Invalid mode: {mode}")
+        logger.error("[InverterV2] Invalid mode: %s", mode)
         return False
 
     def _set_mode_normal(self):
@@ -588,7 +624,7 @@ class FroniusWRV2:
             config = {"timeofuse": timeofuse_list}
             endpoint = "/config/timeofuse"
 
-            logger.debug(f"[InverterV2] Setting timeofuse config: {config}")
+            logger.debug("[InverterV2] Setting timeofuse config: %s", config)
 
             response = self._make_authenticated_request("POST", endpoint, data=config)
 
@@ -602,7 +638,7 @@ class FroniusWRV2:
                             "writeSuccess", []
                         ):
                             logger.error(
-                                f"[InverterV2] Failed to set {expected_write_success}"
+                                "[InverterV2] Failed to set %s", expected_write_success
                             )
                             return False
 
@@ -612,26 +648,24 @@ class FroniusWRV2:
                     return True
 
                 except (ValueError, KeyError, TypeError) as e:
-                    logger.error(f"[InverterV2] Failed to parse response: {e}")
+                    logger.error("[InverterV2] Failed to parse response: %s", e)
                     return False
             else:
                 logger.error(
-                    (
-                        "[InverterV2] Failed to set time of use: "
-                        f"{response.status_code if response else 'No response'}"
-                    )
+                    "[InverterV2] Failed to set time of use: %s",
+                    response.status_code if response else "No response",
                 )
                 return False
 
         except (requests.RequestException, ValueError) as e:
-            logger.error(f"[InverterV2] Error setting time of use: {e}")
+            logger.error("[InverterV2] Error setting time of use: %s", e)
             return False
 
     # EOS Connect compatibility layer
 
     def set_mode_force_charge(self, charge_power_w):
         """EOS Connect compatibility: Force charge mode with specific power."""
-        logger.info(f"[InverterV2] Setting force charge mode with {charge_power_w}W")
+        logger.info("[InverterV2] Setting force charge mode with %sW", charge_power_w)
 
         # Validate power limit
         max_power = min(self.max_grid_charge_rate, 10000)
@@ -640,7 +674,9 @@ class FroniusWRV2:
         # Only warn if the value was actually limited by max_power, not just rounded
         if charge_power_w > max_power:
             logger.warning(
-                f"[InverterV2] Charge power limited from {charge_power_w}W to {charge_power}W"
+                "[InverterV2] Charge power limited from %sW to %sW",
+                charge_power_w,
+                charge_power,
             )
 
         # Create timeofuse configuration for specific charge power
@@ -695,7 +731,7 @@ class FroniusWRV2:
                     battery_info["status"] = "v2_connected"
 
             except (requests.RequestException, ValueError, KeyError) as e:
-                logger.debug(f"[InverterV2] Could not get timeofuse config: {e}")
+                logger.debug("[InverterV2] Could not get timeofuse config: %s", e)
 
             # Try to get storage realtime data
             try:
@@ -705,12 +741,12 @@ class FroniusWRV2:
                     battery_info["status"] = "v2_full_data"
 
             except (requests.RequestException, ValueError, KeyError) as e:
-                logger.debug(f"[InverterV2] Could not get storage data: {e}")
+                logger.debug("[InverterV2] Could not get storage data: %s", e)
 
             return battery_info
 
         except (requests.RequestException, ValueError, KeyError) as e:
-            logger.error(f"[InverterV2] Failed to get battery info: {e}")
+            logger.error("[InverterV2] Failed to get battery info: %s", e)
             return {"status": "error", "mode": "unknown"}
 
     def get_battery_mode(self):
@@ -749,7 +785,7 @@ class FroniusWRV2:
             return "unknown"
 
         except (requests.RequestException, ValueError, KeyError) as e:
-            logger.error(f"[InverterV2] Failed to get battery mode: {e}")
+            logger.error("[InverterV2] Failed to get battery mode: %s", e)
             return "unknown"
 
     def _get_current_timeofuse(self):
@@ -762,11 +798,11 @@ class FroniusWRV2:
                 result = response.json()
                 return result.get("timeofuse", [])
             status_code = response.status_code if response else "No response"
-            logger.error(f"[InverterV2] Failed to get timeofuse: {status_code}")
+            logger.error("[InverterV2] Failed to get timeofuse: %s", status_code)
             return None
 
         except (requests.RequestException, ValueError, KeyError) as e:
-            logger.error(f"[InverterV2] Error getting timeofuse: {e}")
+            logger.error("[InverterV2] Error getting timeofuse: %s", e)
             return None
 
     def _get_storage_realtime_data(self):
@@ -811,12 +847,12 @@ class FroniusWRV2:
 
                 return storage_info
             logger.debug(
-                f"[InverterV2] Storage data request failed: {response.status_code}"
+                "[InverterV2] Storage data request failed: %s", response.status_code
             )
             return None
 
         except (requests.RequestException, ValueError, KeyError) as e:
-            logger.debug(f"[InverterV2] Error getting storage data: {e}")
+            logger.debug("[InverterV2] Error getting storage data: %s", e)
             return None
 
     def backup_current_config(self):
@@ -827,14 +863,14 @@ class FroniusWRV2:
                 with open(self.backup_filename, "w", encoding="utf-8") as f:
                     json.dump(current_config, f, indent=2)
                 logger.info(
-                    f"[InverterV2] Configuration backed up to {self.backup_filename}"
+                    "[InverterV2] Configuration backed up to %s", self.backup_filename
                 )
                 return True
             logger.warning("[InverterV2] No configuration to backup")
             return False
 
         except (OSError, ValueError, KeyError) as e:
-            logger.error(f"[InverterV2] Failed to backup configuration: {e}")
+            logger.error("[InverterV2] Failed to backup configuration: %s", e)
             return False
 
     def restore_backup_config(self):
@@ -842,7 +878,7 @@ class FroniusWRV2:
         try:
             if not os.path.exists(self.backup_filename):
                 logger.warning(
-                    f"[InverterV2] No backup file found: {self.backup_filename}"
+                    "[InverterV2] No backup file found: %s", self.backup_filename
                 )
                 return False
 
@@ -857,12 +893,12 @@ class FroniusWRV2:
                     os.remove(self.backup_filename)
                     logger.info("[InverterV2] Backup restored and backup file removed")
                 except OSError as e:
-                    logger.warning(f"[InverterV2] Could not remove backup file: {e}")
+                    logger.warning("[InverterV2] Could not remove backup file: %s", e)
 
             return success
 
         except (OSError, ValueError, KeyError) as e:
-            logger.error(f"[InverterV2] Failed to restore backup: {e}")
+            logger.error("[InverterV2] Failed to restore backup: %s", e)
             return False
 
     def fetch_inverter_data(self):
@@ -884,7 +920,7 @@ class FroniusWRV2:
 
             if response.status_code != 200:
                 logger.debug(
-                    f"[InverterV2] Inverter monitoring returned {response.status_code}"
+                    "[InverterV2] Inverter monitoring returned %s", response.status_code
                 )
                 return None
 
@@ -897,7 +933,7 @@ class FroniusWRV2:
                 if isinstance(device_data, dict) and "channels" in device_data:
                     channels = device_data.get("channels", {}) or {}
                     logger.debug(
-                        f"[InverterV2] Found inverter data for device: {device_id}"
+                        "[InverterV2] Found inverter data for device: %s", device_id
                     )
                     break
 
@@ -906,36 +942,14 @@ class FroniusWRV2:
                 logger.warning(
                     "[InverterV2] No channel data found in inverter response"
                 )
-                self.inverter_current_data = {
-                    "DEVICE_TEMPERATURE_AMBIENTEMEAN_F32": 0.0,
-                    "MODULE_TEMPERATURE_MEAN_01_F32": 0.0,
-                    "MODULE_TEMPERATURE_MEAN_03_F32": 0.0,
-                    "MODULE_TEMPERATURE_MEAN_04_F32": 0.0,
-                    "FANCONTROL_PERCENT_01_F32": 0.0,
-                    "FANCONTROL_PERCENT_02_F32": 0.0,
-                }
+                self.inverter_current_data = dict.fromkeys(INVERTER_DATA_KEYS, 0.0)
                 return self.inverter_current_data
 
             # Build normalized inverter_current_data with consistent keys
-            ambient_raw = channels.get("DEVICE_TEMPERATURE_AMBIENTMEAN_01_F32", 0)
             self.inverter_current_data = {
                 # Canonical keys used by V2/tests
-                "DEVICE_TEMPERATURE_AMBIENTEMEAN_F32": round(ambient_raw, 2),
-                "MODULE_TEMPERATURE_MEAN_01_F32": round(
-                    channels.get("MODULE_TEMPERATURE_MEAN_01_F32", 0), 2
-                ),
-                "MODULE_TEMPERATURE_MEAN_03_F32": round(
-                    channels.get("MODULE_TEMPERATURE_MEAN_03_F32", 0), 2
-                ),
-                "MODULE_TEMPERATURE_MEAN_04_F32": round(
-                    channels.get("MODULE_TEMPERATURE_MEAN_04_F32", 0), 2
-                ),
-                "FANCONTROL_PERCENT_01_F32": round(
-                    channels.get("FANCONTROL_PERCENT_01_F32", 0), 2
-                ),
-                "FANCONTROL_PERCENT_02_F32": round(
-                    channels.get("FANCONTROL_PERCENT_02_F32", 0), 2
-                ),
+                key: round(channels.get(channel, 0), 2)
+                for key, channel in INVERTER_DATA_CHANNELS
             }
             # Provide backward-compatible alias if some code expects the variant without the extra 'E'
             if "DEVICE_TEMPERATURE_AMBIENTMEAN_F32" not in self.inverter_current_data:
@@ -944,19 +958,12 @@ class FroniusWRV2:
                     self.inverter_current_data["DEVICE_TEMPERATURE_AMBIENTEMEAN_F32"]
                 )
 
-            logger.debug(f"[InverterV2] Inverter data: {self.inverter_current_data}")
+            logger.debug("[InverterV2] Inverter data: %s", self.inverter_current_data)
             return self.inverter_current_data
 
         except (requests.RequestException, ValueError, KeyError) as e:
-            logger.debug(f"[InverterV2] Inverter monitoring unavailable: {e}")
-            self.inverter_current_data = {
-                "DEVICE_TEMPERATURE_AMBIENTEMEAN_F32": 0.0,
-                "MODULE_TEMPERATURE_MEAN_01_F32": 0.0,
-                "MODULE_TEMPERATURE_MEAN_03_F32": 0.0,
-                "MODULE_TEMPERATURE_MEAN_04_F32": 0.0,
-                "FANCONTROL_PERCENT_01_F32": 0.0,
-                "FANCONTROL_PERCENT_02_F32": 0.0,
-            }
+            logger.debug("[InverterV2] Inverter monitoring unavailable: %s", e)
+            self.inverter_current_data = dict.fromkeys(INVERTER_DATA_KEYS, 0.0)
             return None
 
     def get_inverter_current_data(self):
@@ -973,12 +980,12 @@ class FroniusWRV2:
         """
         if max_pv_charge_rate < 0:
             logger.warning(
-                f"[InverterV2] API: Invalid max_pv_charge_rate {max_pv_charge_rate}W"
+                "[InverterV2] API: Invalid max_pv_charge_rate %sW", max_pv_charge_rate
             )
             return
 
         logger.info(
-            f"[InverterV2] API: Setting max_pv_charge_rate: {max_pv_charge_rate}W"
+            "[InverterV2] API: Setting max_pv_charge_rate: %sW", max_pv_charge_rate
         )
         self.max_pv_charge_rate = max_pv_charge_rate
 
@@ -990,12 +997,13 @@ class FroniusWRV2:
         """
         if max_grid_charge_rate < 0:
             logger.warning(
-                f"[InverterV2] API: Invalid max_grid_charge_rate {max_grid_charge_rate}W"
+                "[InverterV2] API: Invalid max_grid_charge_rate %sW",
+                max_grid_charge_rate,
             )
             return
 
         logger.info(
-            f"[InverterV2] API: Setting max_grid_charge_rate: {max_grid_charge_rate}W"
+            "[InverterV2] API: Setting max_grid_charge_rate: %sW", max_grid_charge_rate
         )
         self.max_grid_charge_rate = max_grid_charge_rate
 
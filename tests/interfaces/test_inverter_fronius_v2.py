@@ -8,7 +8,14 @@ HTTP authentication, focusing on inverter data monitoring functionality.
 from unittest.mock import patch, MagicMock, Mock
 import pytest
 import json
-from src.interfaces.inverter_fronius_v2 import FroniusWRV2
+import re
+from src.interfaces.inverter_fronius_v2 import (
+    FroniusWRV2,
+    INVERTER_DATA_KEYS,
+    hash_utf8_md5,
+    hash_utf8_sha256,
+    strip_dict,
+)
 
 # Accessing protected members is fine in white-box tests.
 # pylint: disable=protected-access
@@ -62,25 +69,38 @@ def mock_inverter_data_response():
 
 
 @pytest.fixture
-def fronius_v2_instance(default_config):
+def make_fronius_v2(default_config):
     """
-    Creates a FroniusWRV2 instance with mocked HTTP requests.
+    Returns a builder creating FroniusWRV2 instances with mocked HTTP requests
+    for a given firmware version.
     """
     with patch("src.interfaces.inverter_fronius_v2.requests.Session") as mock_session:
-        version_data = {"swrevisions": {"GEN24": "1.38.6-1"}}
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = json.dumps(version_data)
-        mock_response.json.return_value = version_data
 
-        mock_session_instance = Mock()
-        mock_session_instance.get.return_value = mock_response
-        mock_session_instance.request.return_value = mock_response
-        mock_session.return_value = mock_session_instance
+        def _make(firmware="1.38.6-1"):
+            version_data = {"swrevisions": {"GEN24": firmware}}
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = json.dumps(version_data)
+            mock_response.json.return_value = version_data
+
+            mock_session_instance = Mock()
+            mock_session_instance.get.return_value = mock_response
+            mock_session_instance.request.return_value = mock_response
+            mock_session.return_value = mock_session_instance
+
+            instance = FroniusWRV2(default_config)
+            instance.session = mock_session_instance
+            return instance
+
+        yield _make
+
 
-        instance = FroniusWRV2(default_config)
-        instance.session = mock_session_instance
-        return instance
+@pytest.fixture
+def fronius_v2_instance(make_fronius_v2):
+    """
+    Creates a FroniusWRV2 instance (firmware 1.38.6-1) with mocked HTTP requests.
+    """
+    return make_fronius_v2()
 
 
 class TestFroniusV2Initialization:
@@ -103,50 +123,88 @@ class TestFroniusV2Initialization:
         assert fronius_v2_instance.inverter_sw_revision["patch"] == 6
         assert fronius_v2_instance.inverter_sw_revision["build"] == 1
 
-    def test_api_configuration_new_firmware(self, fronius_v2_instance):
-        """Test API configuration for new firmware (>=1.38.6-1)."""
-        assert fronius_v2_instance.api_base == "/api/"
-        assert fronius_v2_instance.algorithm == "SHA256"
+    @pytest.mark.parametrize(
+        "firmware, api_base, algorithm",
+        [
+            ("1.30.0-1", "/", "MD5"),  # old firmware (<1.36.5-1)
+            ("1.37.0-1", "/api/", "MD5"),  # middle firmware (1.36.5-1 to 1.38.5-x)
+            ("1.38.6-1", "/api/", "SHA256"),  # new firmware (>=1.38.6-1)
+        ],
+    )
+    def test_api_configuration(self, make_fronius_v2, firmware, api_base, algorithm):
+        """Test API base and auth algorithm selection by firmware version."""
+        instance = make_fronius_v2(firmware)
+        assert instance.api_base == api_base
+        assert instance.algorithm == algorithm
+
+
+class TestDigestAuthentication:
+    """Tests for the HTTP digest authentication header."""
+
+    def test_get_nonce_from_challenge(self, fronius_v2_instance):
+        """Test that the nonce is parsed from the (firmware specific) challenge header."""
+        challenge = Mock()
+        challenge.headers = {
+            "X-WWW-Authenticate": 'Digest realm="Webinterface area", '
+            'nonce="a1b2c3", qop="auth", algorithm=SHA256'
+        }
 
-    def test_api_configuration_old_firmware(self, default_config):
-        """Test API configuration for old firmware (<1.36.5-1)."""
-        with patch(
-            "src.interfaces.inverter_fronius_v2.requests.Session"
-        ) as mock_session:
-            version_data = {"swrevisions": {"GEN24": "1.30.0-1"}}
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = json.dumps(version_data)
-            mock_response.json.return_value = version_data
+        assert fronius_v2_instance._get_nonce(challenge) == "a1b2c3"
 
-            mock_session_instance = Mock()
-            mock_session_instance.get.return_value = mock_response
-            mock_session_instance.request.return_value = mock_response
-            mock_session.return_value = mock_session_instance
+    def test_get_nonce_without_challenge_header(self, fronius_v2_instance):
+        """Test that a missing challenge header yields no nonce."""
+        challenge = Mock()
+        challenge.headers = {}
 
-            instance = FroniusWRV2(default_config)
-            assert instance.api_base == "/"
-            assert instance.algorithm == "MD5"
+        assert fronius_v2_instance._get_nonce(challenge) is None
 
-    def test_api_configuration_middle_firmware(self, default_config):
-        """Test API configuration for middle firmware (1.36.5-1 to 1.38.5-x)."""
-        with patch(
-            "src.interfaces.inverter_fronius_v2.requests.Session"
-        ) as mock_session:
-            version_data = {"swrevisions": {"GEN24": "1.37.0-1"}}
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = json.dumps(version_data)
-            mock_response.json.return_value = version_data
+    def test_auth_header_response_digest(self, fronius_v2_instance):
+        """Test that the response digest follows RFC 7616 for SHA256."""
+        header = fronius_v2_instance._create_auth_header(
+            "GET", "/api/config/timeofuse", "abc123", cnonce="xyz"
+        )
 
-            mock_session_instance = Mock()
-            mock_session_instance.get.return_value = mock_response
-            mock_session_instance.request.return_value = mock_response
-            mock_session.return_value = mock_session_instance
+        ha1 = hash_utf8_sha256("customer:Webinterface area:test_password")
+        ha2 = hash_utf8_sha256("GET:/api/config/timeofuse")
+        expected = hash_utf8_sha256(f"{ha1}:abc123:00000001:xyz:auth:{ha2}")
+        assert f'response="{expected}"' in header
+        assert 'algorithm="SHA256"' in header
 
-            instance = FroniusWRV2(default_config)
-            assert instance.api_base == "/api/"
-            assert instance.algorithm == "MD5"
+    def test_ha1_is_computed_once(self, fronius_v2_instance):
+        """Test that HA1 is cached across requests and only HA2/response are rehashed."""
+        with patch(
+            "src.interfaces.inverter_fronius_v2.hash_utf8_sha256",
+            wraps=hash_utf8_sha256,
+        ) as mock_hash:
+            fronius_v2_instance._create_auth_header("GET", "/api/a", "nonce1")
+            fronius_v2_instance._create_auth_header("POST", "/api/b", "nonce2")
+
+        # HA1 + HA2 + response for the first header, HA2 + response for the second
+        assert mock_hash.call_count == 5
+
+    def test_auth_header_uses_fresh_cnonce(self, fronius_v2_instance):
+        """Test that each auth header gets its own random client nonce."""
+        cnonce_pattern = re.compile(r'cnonce="([0-9a-f]{32})"')
+        header1 = fronius_v2_instance._create_auth_header("GET", "/api/a", "nonce1")
+        header2 = fronius_v2_instance._create_auth_header("GET", "/api/a", "nonce1")
+
+        cnonce1 = cnonce_pattern.search(header1).group(1)
+        cnonce2 = cnonce_pattern.search(header2).group(1)
+        assert cnonce1 != cnonce2
+        assert "nc=00000001" in header1
+
+    def test_ha1_cached_per_algorithm(self, fronius_v2_instance):
+        """Test that switching to the MD5 fallback uses an MD5 based HA1."""
+        fronius_v2_instance._create_auth_header("GET", "/api/a", "nonce1")
+        fronius_v2_instance.algorithm = "MD5"
+        header = fronius_v2_instance._create_auth_header(
+            "GET", "/api/a", "nonce1", cnonce="xyz"
+        )
+
+        ha1 = hash_utf8_md5("customer:Webinterface area:test_password")
+        ha2 = hash_utf8_md5("GET:/api/a")
+        expected = hash_utf8_md5(f"{ha1}:nonce1:00000001:xyz:auth:{ha2}")
+        assert f'response="{expected}"' in header
 
 
 class TestInverterDataFetching:
@@ -224,23 +282,17 @@ class TestInverterDataFetching:
             == 0.0
         )
 
-    def test_fetch_inverter_data_404_not_found(self, fronius_v2_instance):
-        """Test handling when endpoint returns 404 (not supported by firmware)."""
+    @pytest.mark.parametrize(
+        "status_code",
+        [
+            404,  # not supported by firmware
+            500,  # any other non-200 status
+        ],
+    )
+    def test_fetch_inverter_data_non_200_status(self, fronius_v2_instance, status_code):
+        """Test handling when endpoint returns a non-200 status code."""
         mock_response = Mock()
-        mock_response.status_code = 404
-
-        fronius_v2_instance._make_authenticated_request = Mock(
-            return_value=mock_response
-        )
-
-        result = fronius_v2_instance.fetch_inverter_data()
-
-        assert result is None
-
-    def test_fetch_inverter_data_non_200_status(self, fronius_v2_instance):
-        """Test handling when endpoint returns non-200 status code."""
-        mock_response = Mock()
-        mock_response.status_code = 500
+        mock_response.status_code = status_code
 
         fronius_v2_instance._make_authenticated_request = Mock(
             return_value=mock_response
@@ -294,8 +346,7 @@ class TestInverterDataFetching:
         result = fronius_v2_instance.fetch_inverter_data()
 
         # Should set all values to 0 when data structure is unexpected
-        assert result is not None
-        assert all(value == 0.0 for value in result.values())
+        assert result == dict.fromkeys(INVERTER_DATA_KEYS, 0.0)
 
     def test_fetch_inverter_data_exception_handling(self, fronius_v2_instance):
         """Test exception handling during data fetch."""
@@ -346,8 +397,8 @@ class TestInverterDataFetching:
 
         result = fronius_v2_instance.get_inverter_current_data()
 
-        # Should call fetch_inverter_data and return empty dict or zeros
-        assert isinstance(result, dict)
+        # Should call fetch_inverter_data and fall back to an empty dict
+        assert result == {}
 
     def test_fetch_inverter_data_uses_correct_endpoint(self, fronius_v2_instance):
         """Test that fetch_inverter_data calls the correct endpoint."""
@@ -450,24 +501,46 @@ class TestInverterDataIntegration:
 class TestAPISetMethods:
     """Tests for API setter methods related to inverter configuration."""
 
-    def test_api_set_max_pv_charge_rate(self, fronius_v2_instance):
-        """Test setting max PV charge rate."""
-        fronius_v2_instance.api_set_max_pv_charge_rate(12000)
-        assert fronius_v2_instance.max_pv_charge_rate == 12000
-
-    def test_api_set_max_pv_charge_rate_negative(self, fronius_v2_instance):
+    @pytest.mark.parametrize(
+        "setter, attribute, value",
+        [
+            ("api_set_max_pv_charge_rate", "max_pv_charge_rate", 12000),
+            ("api_set_max_grid_charge_rate", "max_grid_charge_rate", 8000),
+        ],
+    )
+    def test_api_set_charge_rate(self, fronius_v2_instance, setter, attribute, value):
+        """Test setting max PV / grid charge rate."""
+        getattr(fronius_v2_instance, setter)(value)
+        assert getattr(fronius_v2_instance, attribute) == value
+
+    @pytest.mark.parametrize(
+        "setter, attribute",
+        [
+            ("api_set_max_pv_charge_rate", "max_pv_charge_rate"),
+            ("api_set_max_grid_charge_rate", "max_grid_charge_rate"),
+        ],
+    )
+    def test_api_set_charge_rate_negative(self, fronius_v2_instance, setter, attribute):
         """Test that negative values are rejected."""
-        original_value = fronius_v2_instance.max_pv_charge_rate
-        fronius_v2_instance.api_set_max_pv_charge_rate(-1000)
-        assert fronius_v2_instance.max_pv_charge_rate == original_value
+        original_value = getattr(fronius_v2_instance, attribute)
+        getattr(fronius_v2_instance, setter)(-1000)
+        assert getattr(fronius_v2_instance, attribute) == original_value
 
-    def test_api_set_max_grid_charge_rate(self, fronius_v2_instance):
-        """Test setting max grid charge rate."""
-        fronius_v2_instance.api_set_max_grid_charge_rate(8000)
-        assert fronius_v2_instance.max_grid_charge_rate == 8000
 
-    def test_api_set_max_grid_charge_rate_negative(self, fronius_v2_instance):
-        """Test that negative values are rejected."""
-        original_value = fronius_v2_instance.max_grid_charge_rate
-        fronius_v2_instance.api_set_max_grid_charge_rate(-1000)
-        assert fronius_v2_instance.max_grid_charge_rate == original_value
+class TestStripDict:
+    """Tests for the strip_dict helper."""
+
+    def test_strip_dict_removes_private_keys(self):
+        """Test that keys starting with '_' are removed."""
+        original = {"_comment": "x", "timeofuse": [], "_id": 1}
+        assert strip_dict(original) == {"timeofuse": []}
+        assert "_comment" in original  # original is not modified
+
+    def test_strip_dict_returns_original_without_private_keys(self):
+        """Test that a dict without '_' keys is returned as-is, without copying."""
+        original = {"timeofuse": [], "writeSuccess": ["timeofuse"]}
+        assert strip_dict(original) is original
+
+    def test_strip_dict_non_dict_passthrough(self):
+        """Test that non-dict values are returned unchanged."""
+        assert strip_dict([1, 2]) == [1, 2]